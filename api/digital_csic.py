@@ -1,12 +1,13 @@
 #!/usr/bin/python
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor
 import configparser
 import psycopg2
 import xml.etree.ElementTree as ET
 import re
 import requests
-from api.evaluator import Evaluator
+from api.evaluator import ACCEPTED_DATA_FORMATS, Evaluator, _constant_indicator, _memoize_method
 import pandas as pd
 import api.utils as ut
 import urllib
@@ -35,6 +36,9 @@ class Digital_CSIC(Evaluator):
         Prints the animals name and what sound it makes
     """
 
+    _community_schemas_msg = \
+        'Currently, DIGITAL.CSIC does not include community-bsed schemas. If you need to include yours, please contact.'
+
     def __init__(self, item_id):
         if self.get_doi_str(item_id) != '':
             self.item_id = self.get_doi_str(item_id)
@@ -110,8 +114,8 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
                     msg = msg + "| %s: %s | " % (e.identifier, e.type)
             else:
                 msg = 'Your (meta)data is identified by non-persistent identifiers: '
-                for i, e in id_list:
-                    msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                for row in id_list.itertuples(index=False):
+                    msg = msg + "| %s: %s | " % (row.identifier, row.type)
         else:
             msg = 'Your (meta)data is not identified by persistent identifiers:'
 
@@ -235,6 +239,7 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
         return points, msg
 
 
+    @_constant_indicator
     def rda_a1_05d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1: (Meta)data are retrievable by their
@@ -267,6 +272,7 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
         return (points, msg)
 
 
+    @_constant_indicator
     def rda_a1_2_01d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1.2: The protocol allows for an
@@ -297,6 +303,7 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
             'DIGITAL.CSIC allows restricted access to digital object using institutional AAI'
         return (points, msg)
 
+    @_constant_indicator
     def rda_a2_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A2: Metadata should be accessible even
@@ -343,7 +350,7 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
         oai = requests.get(url)
         msg = ''
         try:
-            xmlTree = ET.fromstring(oai.text)
+            xmlTree = ET.fromstring(oai.content)
             msg = 'Metadata using interoperable representation (XML)'
             points = 100
         except ET.ParseError as err:
@@ -382,39 +389,19 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
         points = 0
         msg = 'Test not implemented'
 
-        standard_list = [
-            'pdf',
-            'csv',
-            'jpg',
-            'jpeg',
-            'nc',
-            'hdf',
-            'mp4',
-            'mp3',
-            'wav',
-            'doc',
-            'txt',
-            'xls',
-            'xlsx',
-            'sgy',
-            'zip',
-        ]
-
         query = \
             "SELECT bitstream.name FROM item2bundle, bundle2bitstream, bitstream WHERE item2bundle.item_id = '%s' AND item2bundle.bundle_id = bundle2bitstream.bundle_id AND bundle2bitstream.bitstream_id = bitstream.bitstream_id" \
             % self.internal_id
         print('Format: %s' % query)
         cursor = self.connection.cursor()
         cursor.execute(query)
-        filename_list = cursor.fetchall()
+        filename_list = [row[0] for row in cursor.fetchall()]
+        print('File formats: %s' % filename_list)
 
-        for row in filename_list:
-            print('File format: %s' % row[0])
-            if row[0].split('.')[-1] in standard_list:
-                points = points + 100 / len(filename_list)
-                msg = 'The digital object is in an standard format'
-
-        if points == 0:
+        points = ut.standard_format_points(filename_list, ACCEPTED_DATA_FORMATS)
+        if points == 100:
+            msg = 'The digital object is in an standard format'
+        elif points == 0:
             msg = \
                 'The digital object is not in an accepted standard format. If you think the format should be accepted, please contact DIGITAL.CSIC'
         elif points < 100:
@@ -430,7 +417,7 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
         oai = requests.get(url)
         msg = ''
         try:
-            xmlTree = ET.fromstring(oai.text)
+            xmlTree = ET.fromstring(oai.content)
             msg = \
                 'Metadata can be extracted using machine-actionable features (XML Metadata)'
             points = 100
@@ -442,6 +429,7 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
 
         return (points, msg)
 
+    @_constant_indicator
     def rda_i1_02d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I1: (Meta)data use a formal, accessible,
@@ -661,18 +649,21 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
         pids = 0
         dois = 0
         try:
-            for (index, row) in self.metadata.iterrows():
-                if len(self.get_orcid_str(row['text_value'])) > 0 \
-                    and self.check_orcid(self.get_orcid_str(row['text_value'
-                                                                ])):
+            checkers = {'orcid': self.check_orcid, 'handle': self.check_handle, 'doi': self.check_doi}
+            checks = []
+            for value in self.metadata['text_value']:
+                kind, identifier = self.classify_identifier(value)
+                if kind is not None:
+                    checks.append((kind, identifier))
+            # Every check is an independent request to a resolver, they are sent concurrently
+            with ThreadPoolExecutor(max_workers=ut._INDICATOR_WORKERS) as executor:
+                resolved = list(executor.map(lambda check: checkers[check[0]](check[1]), checks))
+            for (kind, identifier), ok in zip(checks, resolved):
+                if ok and kind == 'orcid':
                     orcids = orcids + 1
-                if len(self.get_handle_str(row['text_value'])) > 0 \
-                    and self.check_handle(self.get_handle_str(row['text_value'
-                                                                  ])):
+                elif ok and kind == 'handle':
                     pids = pids + 1
-                if len(self.get_doi_str(row['text_value'])) > 0 \
-                    and self.check_doi(self.get_doi_str(row['text_value'
-                                                            ])):
+                elif ok and kind == 'doi':
                     dois = dois + 1
         except Exception as err:
             print('Exception: %s' % err)
@@ -809,54 +800,11 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
 
         return (points, msg)
 
-    def rda_r1_1_02m(self):
-
-        # Check if license is URL
-
-        points = 0
-        msg = ''
-        license = []
-        for (index, row) in self.metadata.iterrows():
-            if row['qualifier'] == 'license':
-                license.append(row['text_value'])
-
-        for row in license:
-            lic_ok = self.check_url(row[0])
-
-        if len(license) and lic_ok:
-            points = 100
-            msg = 'Your license refers to a standard reuse license'
-        else:
-            points = 0
-            msg = \
-                'Your license is NOT included or DOES NOT refer to a standard reuse license'
-
-        return (points, msg)
-
-    def rda_r1_1_03m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.1: (Meta)data are released with a clear
-        and accessible data usage license. More information about that principle can be found here.
-
-        This indicator is about the way that the reuse licence is expressed. Rather than being a
-        human-readable text, the licence should be expressed in such a way that it can be processed
-        by machines, without human intervention, for example in automated searches.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
+    @_memoize_method
+    def _license_standard(self):
+        """ Checks whether the licenses in the metadata resolve to a standard reuse license
         """
+        # Check if license is URL
 
         points = 0
         msg = ''
@@ -865,10 +813,8 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
             if row['qualifier'] == 'license':
                 license.append(row['text_value'])
 
-        for row in license:
-            lic_ok = self.check_url(row[0])
-
-        if len(license) and lic_ok:
+        # Any license resolving to a standard one is enough, stop at the first one
+        if any(map(self.check_url, license)):
             points = 100
             msg = 'Your license refers to a standard reuse license'
         else:
@@ -878,177 +824,6 @@ item.item_id = metadatavalue.item_id AND metadatavalue.metadata_field_id = metad
 
         return (points, msg)
 
-    def rda_r1_2_01m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.2: (Meta)data are associated with
-        detailed provenance. More information about that principle can be found here.
-
-        This indicator requires the metadata to include information about the provenance of the
-        data, i.e. information about the origin, history or workflow that generated the data, in a
-        way that is compliant with the standards that are used in the community in which the data
-        is produced.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DIGITAL.CSIC does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_2_02m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.2: (Meta)data are associated with
-        detailed provenance. More information about that principle can be found here.
-
-        This indicator requires that the metadata provides provenance information according to a
-        cross-domain language.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DIGITAL.CSIC does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_3_01m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards.
-
-        This indicator requires that metadata complies with community standards.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DIGITAL.CSIC does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_3_01d(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards. More information about that principle can be found here.
-
-        This indicator requires that data complies with community standards.
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Your data format does not complies with your community standards. If you think this is wrong, please, contact us to include your format.'
-        return (points, msg)
-
-    def rda_r1_3_02m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards. More information about that principle can be found here.
-
-        This indicator requires that the metadata follows a community standard that has a machineunderstandable expression.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DIGITAL.CSIC does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_3_02d(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards.
-
-        This indicator requires that the data follows a community standard that has a machineunderstandable expression.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DIGITAL.CSIC does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
 # UTILS
 
     def get_internal_id(self, item_id, connection):
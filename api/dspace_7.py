@@ -5,7 +5,8 @@ import configparser
 import json
 import xml.etree.ElementTree as ET
 import requests
-from api.evaluator import Evaluator
+from api.evaluator import ACCEPTED_DATA_FORMATS, Evaluator, _constant_indicator, _memoize_method
+import api.utils as ut
 
 
 class DSpace_7(Evaluator):
@@ -32,6 +33,9 @@ class DSpace_7(Evaluator):
         Prints the animals name and what sound it makes
     """
 
+    _community_schemas_msg = \
+        'Currently, DSpace 7 does not include community-bsed schemas. If you need to include yours, please contact.'
+
     def __init__(self, item_id):
         if self.get_doi_str(item_id) != '':
             self.item_id = self.get_doi_str(item_id)
@@ -120,6 +124,7 @@ class DSpace_7(Evaluator):
 
         return (points, msg)
 
+    @_constant_indicator
     def rda_a1_1_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1.1: The protocol is open, free and
@@ -150,6 +155,7 @@ class DSpace_7(Evaluator):
             'Metadata of this digital object can be accessed via HTTP both manually and automatically (OAI-PMH)'
         return (points, msg)
 
+    @_constant_indicator
     def rda_a1_1_01d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1.1: The protocol is open, free and
@@ -179,6 +185,7 @@ class DSpace_7(Evaluator):
             'Data of this digital object can be accessed via HTTP manually'
         return (points, msg)
 
+    @_constant_indicator
     def rda_a1_2_01d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1.2: The protocol allows for an
@@ -209,6 +216,7 @@ class DSpace_7(Evaluator):
             'DSpace allows restricted access to digital object using institutional AAI'
         return (points, msg)
 
+    @_constant_indicator
     def rda_a2_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A2: Metadata should be accessible even
@@ -257,7 +265,7 @@ class DSpace_7(Evaluator):
         json_check = False
         msg = ''
         try:
-            xmlTree = ET.fromstring(oai.text)
+            xmlTree = ET.fromstring(oai.content)
             xml_check = True
             msg = msg + ' XML '
         except ET.ParseError as err:
@@ -304,30 +312,11 @@ class DSpace_7(Evaluator):
         points = 0
         msg = 'Test not implemented'
 
-        standard_list = [
-            'pdf',
-            'csv',
-            'jpg',
-            'jpeg',
-            'nc',
-            'hdf',
-            'mp4',
-            'mp3',
-            'wav',
-            'doc',
-            'txt',
-            'xls',
-            'xlsx',
-            'sgy',
-            'zip',
-        ]
-
         url = self.base_url + 'api/core/items/%s/bundles' \
             % self.internal_id
         resp = requests.get(url)
         items = json.loads(resp.content)
-        num_files = 0
-        name_files = ''
+        name_files = []
         for e in items['_embedded']['bundles']:
             url = self.base_url + 'api/core/bundles/%s/bitstreams' \
                 % e['uuid']
@@ -336,11 +325,10 @@ class DSpace_7(Evaluator):
             for e_b in files['_embedded']['bitstreams']:
                 print('Bitstream ID: %s | Name: %s' % (e_b['uuid'],
                                                        e_b['name']))
-                name_files = name_files + ' ' + e_b['name']
-                num_files = num_files + 1
-                if e_b['name'].split('.')[-1] in standard_list:
-                    points = points + 100
+                name_files.append(e_b['name'])
 
+        points = ut.standard_format_points(name_files, ACCEPTED_DATA_FORMATS)
+        name_files = ' '.join(name_files)
         if points == 0:
             msg = \
                 'The digital object is not in an accepted standard format. If you think the format should be accepted, please contact DSpace admin'
@@ -728,64 +716,17 @@ class DSpace_7(Evaluator):
 
         return (points, msg)
 
-    def rda_r1_1_02m(self):
-
+    @_memoize_method
+    def _license_standard(self):
+        """ Checks whether the licenses in the metadata resolve to a standard reuse license
+        """
         # TODO check more than one license
         # Check if license is URL
 
         points = 0
         msg = ''
-        lic_ok = False
-        for elem in self.metadata:
-            if 'license' in elem:
-                lic_ok = self.check_url(self.metadata[elem][0]['value'])
-
-        if lic_ok:
-            points = 100
-            msg = 'Your license refers to a standard reuse license'
-        else:
-            points = 0
-            msg = \
-                'Your license is NOT included or DOES NOT refer to a standard reuse license'
-
-        return (points, msg)
-
-    def rda_r1_1_03m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.1: (Meta)data are released with a clear
-        and accessible data usage license. More information about that principle can be found here.
-
-        This indicator is about the way that the reuse licence is expressed. Rather than being a
-        human-readable text, the licence should be expressed in such a way that it can be processed
-        by machines, without human intervention, for example in automated searches.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        # TODO check if it is standard
-
-        points = 0
-        msg = ''
-
-        lic_ok = False
-        for elem in self.metadata:
-            if 'license' in elem:
-                lic_ok = self.check_url(self.metadata[elem][0]['value'])
-
-        if lic_ok:
+        licenses = (self.metadata[elem][0]['value'] for elem in self.metadata if 'license' in elem)
+        if any(map(self.check_url, licenses)):
             points = 100
             msg = 'Your license refers to a standard reuse license'
         else:
@@ -795,177 +736,6 @@ class DSpace_7(Evaluator):
 
         return (points, msg)
 
-    def rda_r1_2_01m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.2: (Meta)data are associated with
-        detailed provenance. More information about that principle can be found here.
-
-        This indicator requires the metadata to include information about the provenance of the
-        data, i.e. information about the origin, history or workflow that generated the data, in a
-        way that is compliant with the standards that are used in the community in which the data
-        is produced.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DSpace 7 does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_2_02m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.2: (Meta)data are associated with
-        detailed provenance. More information about that principle can be found here.
-
-        This indicator requires that the metadata provides provenance information according to a
-        cross-domain language.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DSpace 7 does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_3_01m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards.
-
-        This indicator requires that metadata complies with community standards.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DSpace 7 does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_3_01d(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards. More information about that principle can be found here.
-
-        This indicator requires that data complies with community standards.
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Your data format does not complies with your community standards. If you think this is wrong, please, contact us to include your format.'
-        return (points, msg)
-
-    def rda_r1_3_02m(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards. More information about that principle can be found here.
-
-        This indicator requires that the metadata follows a community standard that has a machineunderstandable expression.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DSpace 7 does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
-    def rda_r1_3_02d(self):
-        """ Indicator RDA-A1-01M
-        This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
-        community standards.
-
-        This indicator requires that the data follows a community standard that has a machineunderstandable expression.
-
-        Technical proposal:
-
-        Parameters
-        ----------
-        item_id : str
-            Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
-            identifier from the repo)
-
-        Returns
-        -------
-        points
-            A number between 0 and 100 to indicate how well this indicator is supported
-        msg
-            Message with the results or recommendations to improve this indicator
-        """
-
-        points = 0
-        msg = \
-            'Currently, DSpace 7 does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
-
 # UTILS
 
     def get_internal_id(self, item_id):
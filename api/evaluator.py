@@ -1,10 +1,123 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import configparser
+from functools import lru_cache, wraps
+import hashlib
 import idutils
+import logging
+from lxml import etree
+import numpy as np
 import pandas as pd
-import xml.etree.ElementTree as ET
 import re
 import requests
+import sqlite3
+import threading
+import time
 import urllib
 import api.utils as ut
+from api.utils import _HEAD_TIMEOUT, _HTTP_POOL_SIZE, _HTTP_TIMEOUT, _SESSION
+
+try:
+    # Linear time engine without backtracking, used for the identifier patterns when installed
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+logger = logging.getLogger(__name__)
+
+# Seconds during which the result of probing an URL, DOI or OAI-PMH record is reused
+_PROBE_TTL = 3600
+
+# Extensions of the files linked from a landing page that are considered data files
+_DATA_EXTS = frozenset([".txt", ".pdf", ".csv", ".nc", ".doc", ".xls", ".zip", ".rar", ".tar", ".png", ".jpg"])
+_DATA_EXT_RE = ut.compile_data_formats(_DATA_EXTS)
+
+# File extensions accepted as standard data formats by rda_i1_01d
+ACCEPTED_DATA_FORMATS = frozenset((
+    'pdf', 'csv', 'jpg', 'jpeg', 'nc', 'hdf', 'mp4', 'mp3', 'wav', 'doc', 'txt', 'xls', 'xlsx',
+    'sgy', 'zip',
+))
+
+# Every identifier scheme detected by idutils contains a digit or a colon, wherever it appears
+# in the value, so only the metadata values matching this are passed to scheme detection
+_PID_RX = re.compile(r'[0-9:]')
+
+# Precompiled XPath expressions for the OAI-PMH responses
+_OAI_NS = {'oai': 'http://www.openarchives.org/OAI/2.0/'}
+_XPATH_FORMAT = etree.XPath('.//oai:metadataFormat', namespaces=_OAI_NS)
+_XPATH_ERROR = etree.XPath('.//oai:error', namespaces=_OAI_NS)
+_XPATH_ERR_COUNT = etree.XPath('count(//oai:error)', namespaces=_OAI_NS)
+
+# Identifiers extracted from free text by get_doi_str, get_handle_str and get_orcid_str
+_DOI_RE_LONG = _re_engine.compile(r'10[\.-]+.[\d\.-]+/[\w\.-]+[\w\.-]+/[\w\.-]+[\w\.-]')
+_DOI_RE_SHORT = _re_engine.compile(r'10[\.-]+.[\d\.-]+/[\w\.-]+[\w\.-]')
+_HANDLE_RE = _re_engine.compile(r'[\d\.-]+/[\w\.-]+[\w\.-]')
+_ORCID_RE = _re_engine.compile(r'\d{4}-\d{4}-\d{4}-\d{3}[\dX]')
+# The three of them in one pattern, for classify_identifier. DOIs are tried before Handles since
+# every DOI also looks like a Handle
+_ID_RE = _re_engine.compile(
+    r'(?P<doi>10[\.-]+.[\d\.-]+/[\w\.-]+[\w\.-]+/[\w\.-]+[\w\.-]|10[\.-]+.[\d\.-]+/[\w\.-]+[\w\.-])'
+    r'|(?P<orcid>\d{4}-\d{4}-\d{4}-\d{3}[\dX])'
+    r'|(?P<handle>[\d\.-]+/[\w\.-]+[\w\.-])')
+
+# (term, qualifier) pairs checked in the metadata records
+_DC_TERMS = (
+    ('contributor', None),
+    ('date', None),
+    ('description', None),
+    ('identifier', None),
+    ('publisher', None),
+    ('rights', None),
+    ('title', None),
+    ('subject', None),
+)
+_ACCESS_TERMS = (('access', ''), ('rights', ''))
+
+
+def _memoize_method(method):
+    """ Caches the result of an indicator on the Evaluator instance, so that the indicators
+    delegating to it do not evaluate it again. The cache is reset when self.metadata is replaced.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        if getattr(self, '_cache', None) is None:
+            self._cache = {}
+        if name not in self._cache:
+            self._cache[name] = method(self)
+        return self._cache[name]
+    return wrapper
+
+
+def _constant_indicator(method):
+    """ Marks an indicator whose result depends neither on the metadata nor on any HTTP probe.
+    run_indicator calls it directly, without harvesting the metadata to build a cache key.
+    """
+    method._constant = True
+    return method
+
+
+# Results of the indicators run through Evaluator.run_indicator, shared by all the evaluators of the
+# process. Keyed by (class, item_id, oai_base, indicator, metadata hash), least recently used first.
+# Each result is stored with the time it was computed and reused during _PROBE_TTL seconds, since
+# most indicators also depend on resources probed over HTTP
+_INDICATOR_CACHE_SIZE = 1024
+_indicator_results = OrderedDict()
+_indicator_lock = threading.Lock()
+
+
+def _requires_metadata(method):
+    """ Scores an indicator with 0 points, without scanning the metadata, when there is no metadata
+    to evaluate.
+    """
+    @wraps(method)
+    def wrapper(self):
+        if self.metadata is None or len(self.metadata) == 0:
+            return (0, 'No metadata could be retrieved for the digital object')
+        return method(self)
+    return wrapper
+
 
 class Evaluator(object):
     """
@@ -17,41 +130,118 @@ class Evaluator(object):
     item_id : str
         Digital Object identifier, which can be a generic one (DOI, PID), or an internal (e.g. an
             identifier from the repo)
+    oai_base : str
+        OAI-PMH endpoint of the repository. The metadata of the item is only harvested from it
+        the first time self.metadata (or self.access_protocols) is accessed
 
     """
 
+    # Returned by the indicators about community standards, which are not evaluated yet
+    _community_schemas_msg = \
+        'Currently, this tool does not include community-bsed schemas. If you need to include yours, please contact.'
+
     def __init__(self, item_id, oai_base=None):
         self.item_id = item_id
         self.oai_base = oai_base
+        self._landing_netloc = urllib.parse.urlparse(oai_base).netloc if oai_base else ''
         self.metadata = None
         self.access_protocols = []
-        
-        if oai_base != None:
-            metadataFormats = oai_metadataFormats(oai_base)
-            dc_prefix = ''
-            for e in metadataFormats:
-                if metadataFormats[e] == 'http://www.openarchives.org/OAI/2.0/oai_dc/':
-                    dc_prefix = e
-            print(dc_prefix)
-
-            id_type = idutils.detect_identifier_schemes(self.item_id)[0]
-
-            item_metadata = oai_get_metadata(oai_check_record_url(oai_base, dc_prefix, self.item_id)).find('.//{http://www.openarchives.org/OAI/2.0/}metadata')
-            data = []
-            for tags in item_metadata.findall('.//'):
-                metadata_schema = tags.tag[0:tags.tag.rfind("}")+1]
-                element = tags.tag[tags.tag.rfind("}")+1:len(tags.tag)]
-                text_value = tags.text
-                qualifier = None
-                data.append([metadata_schema, element, text_value, qualifier])
-            self.metadata = pd.DataFrame(data, columns=['metadata_schema', 'element', 'text_value', 'qualifier'])
-
-        if len(self.metadata) > 0:
-            self.access_protocols = ['http', 'oai-pmh']
+        self._id_scheme = None
+        self._item_id_http = None
+
+    @property
+    def metadata(self):
+        """ DataFrame with columns metadata_schema, element, text_value, qualifier. When it has
+        not been set and oai_base is defined, it is harvested via OAI-PMH on first access. A failed
+        harvest is not retried, its exception is raised again by any later access.
+        """
+        if getattr(self, '_metadata', None) is None and getattr(self, 'oai_base', None) is not None:
+            if getattr(self, '_harvest_error', None) is not None:
+                raise self._harvest_error
+            try:
+                self._metadata = self.oai_harvest_metadata()
+            except Exception as err:
+                self._harvest_error = err
+                raise
+            if len(self._metadata) > 0:
+                self._access_protocols = ['http', 'oai-pmh']
+        return getattr(self, '_metadata', None)
+
+    @metadata.setter
+    def metadata(self, metadata):
+        self._metadata = metadata
+        self._harvest_error = None
+        # Everything derived from the previous metadata is now stale
+        self._by_element = None
+        self._elem_index = None
+        self._namespaces = None
+        self._term_cache = None
+        self._cache = None
+        self._metadata_digest = None
+
+    @property
+    def access_protocols(self):
+        self.metadata  # noqa: the protocols are known once the metadata has been harvested
+        return getattr(self, '_access_protocols', [])
+
+    @access_protocols.setter
+    def access_protocols(self, access_protocols):
+        self._access_protocols = access_protocols
+
+    def oai_harvest_metadata(self):
+        """ Retrieves the Dublin Core record of item_id from the OAI-PMH endpoint oai_base
+
+        Returns
+        -------
+        metadata
+            DataFrame with columns metadata_schema, element, text_value, qualifier
+        """
+        metadataFormats = cached_metadata_formats(self.oai_base)
+        dc_prefix = next((e for e in metadataFormats
+                          if metadataFormats[e] == 'http://www.openarchives.org/OAI/2.0/oai_dc/'), '')
+        logger.debug('OAI-PMH Dublin Core prefix: %s', dc_prefix)
+
+        data = oai_get_metadata(oai_check_record_url(self.oai_base, dc_prefix, self.item_id))
+        metadata = pd.DataFrame.from_records(data, columns=['metadata_schema', 'element', 'text_value', 'qualifier'])
+        # A record only uses a few distinct elements, stored as categories they are compared by code
+        metadata['element'] = metadata['element'].astype('category')
+        return metadata
+
+    def run_indicator(self, name):
+        """ Runs the indicator name (e.g. 'rda_f1_01m'). The result is reused by any later
+        evaluation in the process, during _PROBE_TTL seconds, of the same item with the same
+        metadata. Constant indicators are not cached.
+
+        Returns
+        -------
+        points
+            A number between 0 and 100 to indicate how well this indicator is supported
+        msg
+            Message with the results or recommendations to improve this indicator
+        """
+        indicator = getattr(self, name)
+        if getattr(indicator, '_constant', False):
+            return indicator()
+        key = (type(self).__name__, self.item_id, getattr(self, 'oai_base', None), name,
+               self._get_metadata_digest())
+        now = time.monotonic()
+        with _indicator_lock:
+            entry = _indicator_results.get(key)
+            if entry is not None and now - entry[1] < _PROBE_TTL:
+                _indicator_results.move_to_end(key)
+                return entry[0]
+        result = indicator()
+        with _indicator_lock:
+            _indicator_results[key] = (result, now)
+            _indicator_results.move_to_end(key)
+            if len(_indicator_results) > _INDICATOR_CACHE_SIZE:
+                _indicator_results.popitem(last=False)
+        return result
 
     # TESTS
     #    FINDABLE
 
+    @_memoize_method
     def rda_f1_01m(self):
         """ Indicator RDA-F1-01M
         This indicator is linked to the following principle: F1 (meta)data are assigned a globally
@@ -83,15 +273,19 @@ class Evaluator(object):
         elements = ['identifier'] #Configurable
         id_list = ut.find_ids_in_metadata(self.metadata, elements)
         if len(id_list) > 0:
-            if len(id_list[id_list.type.notnull()]) > 0:
-                msg = 'Your (meta)data is identified with this identifier(s) and type(s): '
+            mask = id_list['type'].notna().to_numpy()
+            if mask.any():
                 points = 100
-                for i, e in id_list[id_list.type.notnull()].iterrows():
-                    msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                parts = []
+                persistent = id_list.iloc[mask]
+                for identifier, id_type in zip(persistent['identifier'].to_numpy(), persistent['type'].to_numpy()):
+                    parts.append("| %s: %s | " % (identifier, id_type))
+                msg = 'Your (meta)data is identified with this identifier(s) and type(s): ' + ''.join(parts)
             else:
-                msg = 'Your (meta)data is identified by non-persistent identifiers: '
-                for i, e in id_list:
-                    msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                parts = []
+                for row in id_list.itertuples(index=False):
+                    parts.append("| %s: %s | " % (row.identifier, row.type))
+                msg = 'Your (meta)data is identified by non-persistent identifiers: ' + ''.join(parts)
         else:
             msg = 'Your (meta)data is not identified by persistent identifiers:'
             
@@ -128,6 +322,7 @@ class Evaluator(object):
         points, msg = self.rda_f1_01m()
         return points, msg
 
+    @_memoize_method
     def rda_f1_02m(self):
         """ Indicator RDA-F1-02M
         This indicator is linked to the following principle: F1 (meta)data are assigned a globally
@@ -160,20 +355,23 @@ class Evaluator(object):
         id_list = ut.find_ids_in_metadata(self.metadata, elements)
         
         if len(id_list) > 0:
-            if len(id_list[id_list.type.notnull()]) > 0:
-                for i, e in id_list[id_list.type.notnull()].iterrows():
-                    if 'url' in e.type:
-                        e.type.remove('url')
-                        if len(e.type) > 0:
+            mask = id_list['type'].notna().to_numpy()
+            if mask.any():
+                persistent = id_list.iloc[mask]
+                for identifier, id_type in zip(persistent['identifier'].to_numpy(), persistent['type'].to_numpy()):
+                    if 'url' in id_type:
+                        id_type.remove('url')
+                        if len(id_type) > 0:
                             msg = 'Your (meta)data is identified with this identifier(s) and type(s): '
                             points = 100
-                            msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                            msg = msg + "| %s: %s | " % (identifier, id_type)
                         else:
-                            msg = "Your (meta)data is identified only by URL identifiers:| %s: %s | " % (e.identifier, e.type)
+                            msg = "Your (meta)data is identified only by URL identifiers:| %s: %s | " % (identifier, id_type)
             else:
-                msg = 'Your (meta)data is identified by non-persistent identifiers: '
-                for i, e in id_list:
-                    msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                parts = []
+                for row in id_list.itertuples(index=False):
+                    parts.append("| %s: %s | " % (row.identifier, row.type))
+                msg = 'Your (meta)data is identified by non-persistent identifiers: ' + ''.join(parts)
         else:
             msg = 'Your (meta)data is not identified by persistent & unique identifiers:'            
 
@@ -262,28 +460,17 @@ class Evaluator(object):
 
         msg = 'Checking Dublin Core'
         
-        terms_quali = [
-            ['contributor', None],
-            ['date', None],
-            ['description', None],
-            ['identifier', None],
-            ['publisher', None],
-            ['rights', None],
-            ['title', None],
-            ['subject', None]
-        ]
-
-        md_term_list = pd.DataFrame(terms_quali, columns=['term', 'qualifier'])
-        md_term_list = ut.check_metadata_terms(self.metadata, md_term_list)
-        points = (100 * (len(md_term_list) - (len(md_term_list) - sum(md_term_list['found']))) \
-                    / len(md_term_list))
+        md_term_list = self._check_terms(_DC_TERMS)
+        found = md_term_list['found'].to_numpy()
+        points = 100 * int(found.sum()) / len(found)
         if points == 100:
             msg = msg + '... All mandatory terms included'
         else:
-            msg = msg + '... Missing terms:'
-            for i, e in md_term_list.iterrows():
-                if e['found'] == 0:
-                    msg = msg + '| term: %s, qualifier: %s' % (e['term'], e['qualifier'])
+            parts = []
+            for term, qualifier, found in md_term_list.itertuples(index=False):
+                if found == 0:
+                    parts.append('| term: %s, qualifier: %s' % (term, qualifier))
+            msg = msg + '... Missing terms:' + ''.join(parts)
 
         return (points, msg)
 
@@ -311,28 +498,17 @@ class Evaluator(object):
         """
         msg = 'Checking Dublin Core as multidisciplinar schema'
         
-        terms_quali = [
-            ['contributor', None],
-            ['date', None],
-            ['description', None],
-            ['identifier', None],
-            ['publisher', None],
-            ['rights', None],
-            ['title', None],
-            ['subject', None]
-        ]
-
-        md_term_list = pd.DataFrame(terms_quali, columns=['term', 'qualifier'])
-        md_term_list = ut.check_metadata_terms(self.metadata, md_term_list)
-        points = (100 * (len(md_term_list) - (len(md_term_list) - sum(md_term_list['found']))) \
-                    / len(md_term_list))
+        md_term_list = self._check_terms(_DC_TERMS)
+        found = md_term_list['found'].to_numpy()
+        points = 100 * int(found.sum()) / len(found)
         if points == 100:
             msg = msg + '... All mandatory terms included'
         else:
-            msg = msg + '... Missing terms:'
-            for i, e in md_term_list.iterrows():
-                if e['found'] == 0:
-                    msg = msg + '| term: %s, qualifier: %s' % (e['term'], e['qualifier'])
+            parts = []
+            for term, qualifier, found in md_term_list.itertuples(index=False):
+                if found == 0:
+                    parts.append('| term: %s, qualifier: %s' % (term, qualifier))
+            msg = msg + '... Missing terms:' + ''.join(parts)
 
         return (points, msg)
 
@@ -367,15 +543,19 @@ class Evaluator(object):
         id_list = ut.find_ids_in_metadata(self.metadata, elements)
         
         if len(id_list) > 0:
-            if len(id_list[id_list.type.notnull()]) > 0:
-                msg = 'Your data is identified with this identifier(s) and type(s): '
+            mask = id_list['type'].notna().to_numpy()
+            if mask.any():
                 points = 100
-                for i, e in id_list[id_list.type.notnull()].iterrows():
-                    msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                parts = []
+                persistent = id_list.iloc[mask]
+                for identifier, id_type in zip(persistent['identifier'].to_numpy(), persistent['type'].to_numpy()):
+                    parts.append("| %s: %s | " % (identifier, id_type))
+                msg = 'Your data is identified with this identifier(s) and type(s): ' + ''.join(parts)
             else:
-                msg = 'Your data is identified by non-persistent identifiers: '
-                for i, e in id_list.iterrows():
-                    msg = msg + "| %s: %s | " % (e.identifier, e.type)
+                parts = []
+                for identifier, id_type in zip(id_list['identifier'].to_numpy(), id_list['type'].to_numpy()):
+                    parts.append("| %s: %s | " % (identifier, id_type))
+                msg = 'Your data is identified by non-persistent identifiers: ' + ''.join(parts)
         else:
             msg = 'Your data is not identified by persistent identifiers:'
             
@@ -409,7 +589,7 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        if len(self.metadata) > 0:
+        if self.metadata is not None and len(self.metadata) > 0:
             points = 100
             msg = \
                 'Your digital object is available via OAI-PMH harvesting protocol'
@@ -453,19 +633,17 @@ class Evaluator(object):
         # 1 - Check metadata record for access info
         msg = 'Checking Dublin Core'
         points = 0
-        terms_quali = [['access', ''], ['rights', '']]
-
-        md_term_list = pd.DataFrame(terms_quali, columns=['term', 'qualifier'])
-        md_term_list = ut.check_metadata_terms(self.metadata, md_term_list)
-        if sum(md_term_list['found']) > 0:
-            for index, elem in md_term_list.iterrows():
-                if elem['found'] == 1:
-                    msg = msg + "| Metadata: %s.%s: ... %s" % (elem['term'], elem['qualifier'], self.metadata.loc[self.metadata['element'] == elem['term']].loc[self.metadata['qualifier'] == elem['qualifier']])
+        md_term_list = self._check_terms(_ACCESS_TERMS)
+        if md_term_list['found'].to_numpy().sum() > 0:
+            parts = []
+            for term, qualifier, found in md_term_list.itertuples(index=False):
+                if found == 1:
+                    parts.append("| Metadata: %s.%s: ... %s" % (term, qualifier, self._get_metadata_rows(term, qualifier)))
                     points = 100
+            msg = msg + ''.join(parts)
         # 2 - Parse HTML in order to find the data file
-        data_formats = [".txt", ".pdf", ".csv", ".nc", ".doc", ".xls", ".zip", ".rar", ".tar", ".png", ".jpg"]
-        item_id_http = idutils.to_url(self.item_id, idutils.detect_identifier_schemes(self.item_id)[0], url_scheme='http')
-        msg_2, points_2, data_files = ut.find_dataset_file(self.metadata, item_id_http, data_formats)
+        item_id_http = self._get_item_id_http()
+        msg_2, points_2, data_files = ut.find_dataset_file(self.metadata, item_id_http, _DATA_EXT_RE)
         if points_2 == 100 and points == 100:
             msg = "%s \n Data can be accessed manually | %s" % (msg, msg_2)
         elif points_2 == 0 and points == 100:
@@ -506,7 +684,7 @@ class Evaluator(object):
             Message with the results or recommendations to improve this indicator
         """
         # 2 - Look for the metadata terms in HTML in order to know if they can be accessed manually
-        item_id_http = idutils.to_url(self.item_id, idutils.detect_identifier_schemes(self.item_id)[0], url_scheme='http')
+        item_id_http = self._get_item_id_http()
         points, msg = ut.metadata_human_accessibility(self.metadata, item_id_http)
         return (points, msg)
 
@@ -544,15 +722,14 @@ class Evaluator(object):
         """
         points = 0
         msg = 'Checking Dublin Core'
-        terms_quali = [['access', ''], ['rights', '']]
-
-        md_term_list = pd.DataFrame(terms_quali, columns=['term', 'qualifier'])
-        md_term_list = ut.check_metadata_terms(self.metadata, md_term_list)
-        if sum(md_term_list['found']) > 0:
-            for index, elem in md_term_list.iterrows():
-                if elem['found'] == 1:
-                    msg = msg + "| Metadata: %s.%s: ... %s" % (elem['term'], elem['qualifier'], metadata.loc[metadata['element'] == elem['term']].loc[metadata['qualifier'] == elem['qualifier']])
+        md_term_list = self._check_terms(_ACCESS_TERMS)
+        if md_term_list['found'].to_numpy().sum() > 0:
+            parts = []
+            for term, qualifier, found in md_term_list.itertuples(index=False):
+                if found == 1:
+                    parts.append("| Metadata: %s.%s: ... %s" % (term, qualifier, self._get_metadata_rows(term, qualifier)))
                     points = 100
+            msg = msg + ''.join(parts)
         return points, msg
 
     def rda_a1_03m(self):
@@ -580,12 +757,13 @@ class Evaluator(object):
             Message with the results or recommendations to improve this indicator
         """
         # 1 - Look for the metadata terms in HTML in order to know if they can be accessed manueally
-        item_id_http = idutils.to_url(self.item_id, idutils.detect_identifier_schemes(self.item_id)[0], url_scheme='http')
+        item_id_http = self._get_item_id_http()
         points, msg = ut.metadata_human_accessibility(self.metadata, item_id_http)
         msg = "%s \nMetadata found via Identifier" % msg
         return (points, msg)
      
 
+    @_memoize_method
     def rda_a1_03d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1: (Meta)data are retrievable by their
@@ -615,28 +793,23 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        landing_url = urllib.parse.urlparse(self.oai_base).netloc
-        data_formats = [".txt", ".pdf", ".csv", ".nc", ".doc", ".xls", ".zip", ".rar", ".tar", ".png", ".jpg"]
-        item_id_http = idutils.to_url(self.item_id, idutils.detect_identifier_schemes(self.item_id)[0], url_scheme='http')
-        points, msg, data_files = ut.find_dataset_file(self.metadata, item_id_http, data_formats)
+        landing_url = self._landing_netloc
+        item_id_http = self._get_item_id_http()
+        points, msg, data_files = ut.find_dataset_file(self.metadata, item_id_http, _DATA_EXT_RE)
 
-        headers = []
+        urls = []
         for f in data_files:
-            try:
-                url = landing_url + f
-                if 'http' not in url:
-                    url = "http://" + url
-                res = requests.head(url, verify=False)
-                if res.status_code == 200:
-                    headers.append(res.headers)
-            except Exception as e:
-                print(e)
-            try:
-                res = requests.head(f, verify=False)
-                if res.status_code == 200:
+            url = landing_url + f
+            if 'http' not in url:
+                url = "http://" + url
+            urls.append(url)
+            urls.append(f)
+
+        headers = []
+        with ThreadPoolExecutor(max_workers=_HTTP_POOL_SIZE) as executor:
+            for res in executor.map(head_request, urls):
+                if res is not None and res.status_code == 200:
                     headers.append(res.headers)
-            except Exception as e:
-                print(e)
         if len(headers) > 0:
             msg = msg + "\n Files can be downloaded: %s" % headers
             points = 100
@@ -671,8 +844,9 @@ class Evaluator(object):
         """
         msg = ''
         points = 0
-        if len(self.access_protocols) > 0:
-            msg = "Metadata can be accessed through these protocols: %s" % self.access_protocols
+        access_protocols = self.access_protocols
+        if len(access_protocols) > 0:
+            msg = f"Metadata can be accessed through these protocols: {access_protocols}"
             points = 100
         else:
             msg = "No protocols found to access metadata"
@@ -711,6 +885,7 @@ class Evaluator(object):
         return (points, msg)
 
     
+    @_constant_indicator
     def rda_a1_05d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1: (Meta)data are retrievable by their
@@ -765,9 +940,10 @@ class Evaluator(object):
         """
         points = 0
         msg = ''
-        if len(self.access_protocols) > 0:
+        access_protocols = self.access_protocols
+        if len(access_protocols) > 0:
             points = 100
-            msg = "Metadata is accessible using these free protocols: %s" % self.access_protocols
+            msg = f"Metadata is accessible using these free protocols: {access_protocols}"
         else:
             points = 0
             msg = "Metadata can not be accessed via free protocols"
@@ -803,6 +979,7 @@ class Evaluator(object):
             msg = "No FREE protocol for downloading data can be found"
         return (points, msg)
 
+    @_constant_indicator
     def rda_a1_2_01d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A1.2: The protocol allows for an
@@ -832,6 +1009,7 @@ class Evaluator(object):
         return points, msg
 
 
+    @_constant_indicator
     def rda_a2_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: A2: Metadata should be accessible even
@@ -889,7 +1067,7 @@ class Evaluator(object):
         """
         points = 0
         msg = ''
-        if len(self.metadata) > 0:
+        if self.metadata is not None and len(self.metadata) > 0:
             msg = 'Metadata using interoperable representation (XML)'
             points = 100
         else:
@@ -898,6 +1076,7 @@ class Evaluator(object):
         return (points, msg) 
 
 
+    @_constant_indicator
     def rda_i1_01d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I1: (Meta)data use a formal, accessible,
@@ -925,24 +1104,6 @@ class Evaluator(object):
         points = 0
         msg = 'Test not implemented'
 
-        standard_list = [
-            'pdf',
-            'csv',
-            'jpg',
-            'jpeg',
-            'nc',
-            'hdf',
-            'mp4',
-            'mp3',
-            'wav',
-            'doc',
-            'txt',
-            'xls',
-            'xlsx',
-            'sgy',
-            'zip',
-        ]
-
         if points == 0:
             msg = \
                 'The digital object is not in an accepted standard format. If you think the format should be accepted, please contact DIGITAL.CSIC'
@@ -979,7 +1140,7 @@ class Evaluator(object):
         """
         points = 0
         msg = ''
-        if len(self.metadata) > 0:
+        if self.metadata is not None and len(self.metadata) > 0:
             msg = \
                 'Metadata can be extracted using machine-actionable features (XML Metadata)'
             points = 100
@@ -989,6 +1150,7 @@ class Evaluator(object):
         return (points, msg)
 
 
+    @_constant_indicator
     def rda_i1_02d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I1: (Meta)data use a formal, accessible,
@@ -1020,6 +1182,7 @@ class Evaluator(object):
         return (points, msg)
 
 
+    @_requires_metadata
     def rda_i2_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I2: (Meta)data use vocabularies that follow
@@ -1047,25 +1210,24 @@ class Evaluator(object):
         points = 0
         msg = ''
 
-        namespace_list = self.metadata['metadata_schema'].unique()
-        schemas = ''
+        namespace_list = self._get_namespaces()
+        # Schema URLs are checked concurrently, each check is a network round trip
+        resolved = check_urls_bulk(namespace_list, concurrency=ut._INDICATOR_WORKERS)
         for row in namespace_list:
-            row = row.replace('{','')
-            row = row.replace('}','')
-            schemas = schemas + ' ' + row
-            if self.check_url(row):
+            if resolved[row]:
                 points = points + 100 / len(namespace_list)
-                msg = \
-                    'The metadata standard is well-document within a persistent identifier'
 
         if points == 0:
             msg = \
                 'The metadata standard documentation can not be retrieved. Schema(s): %s' \
-                % schemas
+                % ' '.join(namespace_list)
         elif points < 100:
             msg = \
                 'Some of the metadata schemas used are not accessible via persistent identifier. Schema(s): %s' \
-                % schemas
+                % ' '.join(namespace_list)
+        else:
+            msg = \
+                'The metadata standard is well-document within a persistent identifier'
 
         return (points, msg)
 
@@ -1097,6 +1259,7 @@ class Evaluator(object):
         return (points, msg)
 
 
+    @_requires_metadata
     def rda_i3_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I3: (Meta)data include qualified references
@@ -1124,13 +1287,10 @@ class Evaluator(object):
         points = 0
         msg = ''
 
-        orcids = 0
-        pids = 0
-        for (index, row) in self.metadata.iterrows():
-            if row['element'] == 'contributor':
-                orcids = orcids + 1
-            if row['element'] == 'relation':
-                pids = pids + 1
+        # Both counts come from the shared element index, built in a single pass over the column
+        element_index = self._get_element_index()
+        orcids = len(element_index.get('contributor', ()))
+        pids = len(element_index.get('relation', ()))
 
         if orcids > 0 or pids > 0:
             points = 100
@@ -1171,6 +1331,7 @@ class Evaluator(object):
         """
         return self.rda_i3_01m()
 
+    @_requires_metadata
     def rda_i3_02m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I3: (Meta)data include qualified references
@@ -1199,20 +1360,30 @@ class Evaluator(object):
         points = 0
         msg = ''
         references = 0
-        ref_types = ''
-
-        for (index, row) in self.metadata.iterrows():
-            identifiers_scheme = idutils.detect_identifier_schemes(row['text_value'])
+        ref_types_list = []
+
+        # Values without a digit or a colon (titles, names, access rights...) can not be identifiers
+        # and are skipped without running every idutils pattern on them
+        text_values = self.metadata['text_value']
+        candidates = text_values[text_values.str.contains(_PID_RX, na=False)].to_numpy()
+        # The item_id is normalized once for each of its own schemes, a value of any other scheme
+        # can not be the item itself
+        self_norms = {scheme: idutils.normalize_pid(self.item_id, scheme)
+                      for scheme in idutils.detect_identifier_schemes(self.item_id)}
+        for value in candidates:
+            identifiers_scheme = idutils.detect_identifier_schemes(value)
             if len(identifiers_scheme) > 0:
-                if idutils.normalize_pid(row['text_value'], identifiers_scheme[0]) != idutils.normalize_pid(self.item_id, identifiers_scheme[0]): 
-                    references = references + 1
-                    ref_types = ref_types + identifiers_scheme
+                scheme = identifiers_scheme[0]
+                if scheme in self_norms and idutils.normalize_pid(value, scheme) == self_norms[scheme]:
+                    continue
+                references = references + 1
+                ref_types_list.extend(identifiers_scheme)
                 
         if references > 0:
             points = 100
             msg = \
                 'Your (meta)data includes %i qualified references to other digital objects. Types: %s. Do you think you can improve that information?' \
-                % (references, ref_types)
+                % (references, ','.join(ref_types_list))
         else:
 
             points = 0
@@ -1250,6 +1421,7 @@ class Evaluator(object):
         return self.rda_i3_02m()
 
 
+    @_requires_metadata
     def rda_i3_03m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: I3: (Meta)data include qualified references
@@ -1276,11 +1448,9 @@ class Evaluator(object):
         """
         points = 0
         msg = ''
-        qualifiers = ''
-        for (index, row) in self.metadata.iterrows():
-            if row['element'] == 'relation':
-                qualifiers = qualifiers + ' %s' % row['text_value']
-        if qualifiers != '':
+        relations = self._get_element_values('relation')
+        if len(relations) > 0:
+            qualifiers = ' '.join(map(str, relations))
             points = 100
             msg = \
                 'Your (meta)data is connected with the following relationships: %s' \
@@ -1323,6 +1493,7 @@ class Evaluator(object):
 
     # REUSABLE
 
+    @_constant_indicator
     def rda_r1_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1: (Meta)data are richly described with a
@@ -1351,6 +1522,7 @@ class Evaluator(object):
         msg = "Test not implemented"
         return points, msg
 
+    @_requires_metadata
     def rda_r1_1_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.1: (Meta)data are released with a clear
@@ -1376,10 +1548,7 @@ class Evaluator(object):
         """
         points = 0
         msg = ''
-        license = []
-        for (index, row) in self.metadata.iterrows():
-            if row['element'] == 'license':
-                license.append(row['text_value'])
+        license = list(self._get_element_values('license'))
 
         if len(license) > 0:
             points = 100
@@ -1414,25 +1583,7 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        points = 0
-        msg = ''
-        license = []
-        for (index, row) in self.metadata.iterrows():
-            if row['element'] == 'license':
-                license.append(row['text_value'])
-
-        for row in license:
-            lic_ok = self.check_url(row[0])
-
-        if len(license) and lic_ok:
-            points = 100
-            msg = 'Your license refers to a standard reuse license'
-        else:
-            points = 0
-            msg = \
-                'Your license is NOT included or DOES NOT refer to a standard reuse license'
-
-        return (points, msg)
+        return self._license_standard()
 
     def rda_r1_1_03m(self):
         """ Indicator RDA-A1-01M
@@ -1458,27 +1609,10 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        points = 0
-        msg = ''
-        license = []
-        for (index, row) in self.metadata.iterrows():
-            if row['element'] == 'license':
-                license.append(row['text_value'])
-
-        for row in license:
-            lic_ok = self.check_url(row[0])
-
-        if len(license) and lic_ok:
-            points = 100
-            msg = 'Your license refers to a standard reuse license'
-        else:
-            points = 0
-            msg = \
-                'Your license is NOT included or DOES NOT refer to a standard reuse license'
-
-        return (points, msg)
+        return self._license_standard()
 
 
+    @_constant_indicator
     def rda_r1_2_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.2: (Meta)data are associated with
@@ -1504,12 +1638,10 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        points = 0
-        msg = \
-            'Currently, this tool does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
+        return (0, self._community_schemas_msg)
 
 
+    @_constant_indicator
     def rda_r1_2_02m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.2: (Meta)data are associated with
@@ -1533,12 +1665,10 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        points = 0
-        msg = \
-            'Currently, this tool does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
+        return (0, self._community_schemas_msg)
 
 
+    @_constant_indicator
     def rda_r1_3_01m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
@@ -1561,12 +1691,10 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        points = 0
-        msg = \
-            'Currently, this tool does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
+        return (0, self._community_schemas_msg)
 
 
+    @_constant_indicator
     def rda_r1_3_01d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
@@ -1594,6 +1722,7 @@ class Evaluator(object):
         return (points, msg)
 
 
+    @_constant_indicator
     def rda_r1_3_02m(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
@@ -1616,11 +1745,9 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
-        points = 0
-        msg = \
-            'Currently, this tool does not include community-bsed schemas. If you need to include yours, please contact.'
-        return (points, msg)
+        return (0, self._community_schemas_msg)
 
+    @_constant_indicator
     def rda_r1_3_02d(self):
         """ Indicator RDA-A1-01M
         This indicator is linked to the following principle: R1.3: (Meta)data meet domain-relevant
@@ -1643,84 +1770,155 @@ class Evaluator(object):
         msg
             Message with the results or recommendations to improve this indicator
         """
+        return (0, self._community_schemas_msg)
+
+    # UTILS
+    @_requires_metadata
+    @_memoize_method
+    def _license_standard(self):
+        """ Checks whether the licenses in the metadata resolve to a standard reuse license. Shared by
+        rda_r1_1_02m and rda_r1_1_03m so the license URLs are only checked once per evaluation.
+        """
         points = 0
-        msg = \
-            'Currently, this tool does not include community-bsed schemas. If you need to include yours, please contact.'
+        msg = ''
+        license = list(self._get_element_values('license'))
+
+        # Any license resolving to a standard one is enough, stop at the first one
+        if any(map(self.check_url, license)):
+            points = 100
+            msg = 'Your license refers to a standard reuse license'
+        else:
+            points = 0
+            msg = \
+                'Your license is NOT included or DOES NOT refer to a standard reuse license'
+
         return (points, msg)
 
-    # UTILS
+    def _get_item_id_http(self):
+        """ Returns the HTTP URL of item_id. The identifier scheme is detected only once per
+        Evaluator and reused by every indicator that needs to resolve the item.
+        """
+        if getattr(self, '_item_id_http', None) is None:
+            self._id_scheme = idutils.detect_identifier_schemes(self.item_id)[0]
+            self._item_id_http = idutils.to_url(self.item_id, self._id_scheme, url_scheme='http')
+        return self._item_id_http
+
+    def _get_element_index(self):
+        """ Returns a dict mapping each metadata element to the positions of its rows. The index
+        is built once per metadata DataFrame, so indicators can look up an element without
+        scanning the whole DataFrame each time.
+        """
+        if getattr(self, '_by_element', None) is None:
+            self._by_element = self.metadata.groupby('element', sort=False, observed=True).indices
+        return self._by_element
+
+    def _get_element_values(self, element):
+        """ Returns an array with the text values of the metadata rows of element
+        """
+        if getattr(self, '_elem_index', None) is None:
+            text_values = self.metadata['text_value'].to_numpy()
+            self._elem_index = {k: text_values[v] for k, v in self._get_element_index().items()}
+        return self._elem_index.get(element, ())
+
+    def _get_namespaces(self):
+        """ Returns the distinct metadata schemas used in the metadata, without the braces of the
+        {namespace} notation
+        """
+        if getattr(self, '_namespaces', None) is None:
+            self._namespaces = [row.replace('{', '').replace('}', '')
+                                for row in self.metadata['metadata_schema'].unique()]
+        return self._namespaces
+
+    def _get_metadata_digest(self):
+        """ Returns a digest of the metadata contents, used to key the results of run_indicator
+        """
+        if getattr(self, '_metadata_digest', None) is None:
+            metadata = self.metadata
+            if isinstance(metadata, pd.DataFrame):
+                data = pd.util.hash_pandas_object(metadata, index=False).to_numpy().tobytes()
+            else:
+                data = repr(metadata).encode()
+            self._metadata_digest = hashlib.sha1(data).hexdigest()
+        return self._metadata_digest
+
+    def _get_metadata_rows(self, term, qualifier):
+        """ Returns the metadata rows whose element is term and whose qualifier is qualifier
+        """
+        positions = np.asarray(self._get_element_index().get(term, []), dtype=int)
+        match = self.metadata['qualifier'].to_numpy()[positions] == qualifier
+        return self.metadata.iloc[positions[match]]
+
+    def _check_terms(self, terms_quali):
+        """ Returns the result of ut.check_metadata_terms for a list of (term, qualifier) pairs.
+        Results are cached per term list, so indicators checking the same terms (e.g. the
+        generic and disciplinar F2 tests) only scan the metadata once.
+        """
+        if getattr(self, '_term_cache', None) is None:
+            self._term_cache = {}
+        key = tuple(tuple(e) for e in terms_quali)
+        if key not in self._term_cache:
+            self._term_cache[key] = ut.check_metadata_terms(self.metadata, key)
+        return self._term_cache[key]
+
     def get_doi_str(self, doi_str):
-        doi_to_check = re.findall(
-            r'10[\.-]+.[\d\.-]+/[\w\.-]+[\w\.-]+/[\w\.-]+[\w\.-]', doi_str)
-        if len(doi_to_check) == 0:
-            doi_to_check = re.findall(
-                r'10[\.-]+.[\d\.-]+/[\w\.-]+[\w\.-]', doi_str)
-        if len(doi_to_check) != 0:
-            return doi_to_check[0]
+        doi_to_check = _DOI_RE_LONG.search(doi_str) or _DOI_RE_SHORT.search(doi_str)
+        if doi_to_check is not None:
+            return doi_to_check.group(0)
         else:
             return ''
 
     def get_handle_str(self, pid_str):
-        handle_to_check = re.findall(r'[\d\.-]+/[\w\.-]+[\w\.-]', pid_str)
-        if len(handle_to_check) != 0:
-            return handle_to_check[0]
+        handle_to_check = _HANDLE_RE.search(pid_str)
+        if handle_to_check is not None:
+            return handle_to_check.group(0)
         else:
             return ''
 
     def get_orcid_str(self, orcid_str):
-        orcid_to_check = re.findall(
-            r'[\d\.-]+-[\w\.-]+-[\w\.-]+-[\w\.-]', orcid_str)
-        if len(orcid_to_check) != 0:
-            return orcid_to_check[0]
+        orcid_to_check = _ORCID_RE.search(orcid_str)
+        if orcid_to_check is not None:
+            return orcid_to_check.group(0)
         else:
             return ''
 
+    def classify_identifier(self, id_str):
+        """ Returns (kind, identifier) for the first DOI, ORCID or Handle found in id_str, with
+        kind one of 'doi', 'orcid' or 'handle'. Returns (None, '') if there is none, or if id_str
+        is not a string (e.g. a NULL metadata value).
+        """
+        if not isinstance(id_str, str):
+            return (None, '')
+        match = _ID_RE.search(id_str)
+        if match is not None:
+            for kind, identifier in match.groupdict().items():
+                if identifier is not None:
+                    return (kind, identifier)
+        return (None, '')
+
+    # The identifiers are validated with idutils first, so a malformed one is rejected without a
+    # round trip to its resolver
     def check_doi(self, doi):
-        url = "http://dx.doi.org/%s" % str(doi)  # DOI solver URL
-        # Type of response accpeted
-        headers = {'Accept': 'application/vnd.citationstyles.csl+json;q=1.0'}
-        r = requests.post(url, headers=headers)  # POST with headers
-        print(r.status_code)
-        if r.status_code == 200:
-            return True
-        else:
+        if not idutils.is_doi(str(doi)):
             return False
+        return _check_doi(str(doi))
 
     def check_handle(self, pid):
+        if not idutils.is_handle(pid):
+            return False
         handle_base_url = "http://hdl.handle.net/"
         return self.check_url(handle_base_url + pid)
 
     def check_orcid(self, orcid):
+        if not idutils.is_orcid(orcid):
+            return False
         orcid_base_url = "https://orcid.org/"
         return self.check_url(orcid_base_url + orcid)
 
     def check_url(self, url):
-        try:
-            resp = False
-            r = requests.get(url, verify=False)  # Get URL
-            print(url)
-            if r.status_code == 200:
-                resp = True
-            else:
-                resp = False
-        except Exception as err:
-            resp = False
-            print("Error: %s" % err)
-        return resp
+        return _check_url(url)
 
     def check_oai_pmh_item(self, base_url, identifier):
-        try:
-            resp = False
-            url = "%s?verb=GetRecord&metadataPrefix=oai_dc&identifier=%s" % (
-                base_url, identifier)
-            print("OAI-PMH URL: %s" % url)
-            r = requests.get(url, verify=False)  # Get URL
-            xmlTree = ET.fromstring(r.text)
-            resp = True
-        except Exception as err:
-            resp = False
-            print("Error: %s" % err)
-        return resp
+        return _check_oai_pmh_item(base_url, identifier)
 
     def get_color(self, points):
         color = "#F4D03F"
@@ -1739,84 +1937,324 @@ class Evaluator(object):
             test_status = 'pass'
         return test_status
 
+    def get_colors(self, points):
+        """ Same as get_color, for an array of points at once
+        """
+        points = np.asarray(points)
+        return np.select([points < 50, points > 80], ["#E74C3C", "#2ECC71"], default="#F4D03F")
+
+    def test_statuses(self, points):
+        """ Same as test_status, for an array of points at once
+        """
+        points = np.asarray(points)
+        return np.select([points >= 75, points > 50], ['pass', 'indeterminate'], default='fail')
+
+
+@lru_cache(maxsize=1)
+def _url_cache():
+    """ Opens the on-disk cache of check_url results configured in the [Generic] section of
+    config.ini (url_cache is the sqlite file, url_cache_ttl its lifetime in days). Returns None
+    when it is not configured or can not be opened, and URLs are then always requested.
+    """
+    config = configparser.ConfigParser()
+    config.read('config.ini')
+    path = config.get('Generic', 'url_cache', fallback='').strip()
+    if not path:
+        return None
+    try:
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute('CREATE TABLE IF NOT EXISTS url_check '
+                     '(url TEXT PRIMARY KEY, ok INTEGER, fetched_at REAL)')
+        conn.commit()
+    except sqlite3.Error as err:
+        logger.warning("Error opening URL cache %s: %s", path, err)
+        return None
+    ttl = config.getfloat('Generic', 'url_cache_ttl', fallback=30) * 24 * 3600
+    return conn, ttl, threading.Lock()
+
+
+def _url_cache_get(url):
+    """ Returns the cached check_url result for url, or None if it is missing or expired
+    """
+    cache = _url_cache()
+    if cache is None:
+        return None
+    conn, ttl, lock = cache
+    try:
+        with lock:
+            row = conn.execute('SELECT ok, fetched_at FROM url_check WHERE url = ?', (url,)).fetchone()
+    except sqlite3.Error as err:
+        logger.warning("Error reading URL cache: %s", err)
+        return None
+    if row is None or time.time() - row[1] >= ttl:
+        return None
+    return bool(row[0])
+
+
+def _url_cache_set(url, ok):
+    """ Stores the check_url result for url in the on-disk cache, if configured
+    """
+    cache = _url_cache()
+    if cache is None:
+        return
+    conn, ttl, lock = cache
+    try:
+        with lock:
+            conn.execute('INSERT OR REPLACE INTO url_check VALUES (?, ?, ?)', (url, int(ok), time.time()))
+            conn.commit()
+    except sqlite3.Error as err:
+        logger.warning("Error writing URL cache: %s", err)
+
+
+def _ttl_cache(maxsize, ttl):
+    """ Like functools.lru_cache, but a result is only reused during ttl seconds after being
+    computed, since the resources probed over HTTP may appear or disappear over time.
+    """
+    def decorator(func):
+        entries = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and now - entry[1] < ttl:
+                    entries.move_to_end(args)
+                    return entry[0]
+            value = func(*args)
+            with lock:
+                entries[args] = (value, now)
+                entries.move_to_end(args)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(maxsize=4096, ttl=_PROBE_TTL)
+def _check_url(url):
+    """ Returns True if url resolves. Only the headers are requested, and 402/403 answers count
+    as resolved since they come from an existing resource behind a paywall or a login. Servers
+    not supporting HEAD are asked with a GET whose body is never downloaded.
+    Results, either positive or negative, are cached in memory for an hour, so a schema or
+    license URL shared by several indicators or items is only requested once. Definitive answers
+    (resolved, 404 or 410) are also kept in the on-disk URL cache, if configured, to be reused
+    across processes, while server errors and rate limits are asked again in the next run.
+    """
+    cached = _url_cache_get(url)
+    if cached is not None:
+        return cached
+    try:
+        resp = False
+        r = _SESSION.head(url, timeout=_HEAD_TIMEOUT, allow_redirects=True)
+        if r.status_code in (405, 501):
+            with _SESSION.get(url, timeout=_HTTP_TIMEOUT, stream=True) as r:
+                pass
+        logger.debug("%s: %s", url, r.status_code)
+        if r.status_code < 400 or r.status_code in (402, 403):
+            resp = True
+        else:
+            resp = False
+        if resp or r.status_code in (404, 410):
+            _url_cache_set(url, resp)
+    except requests.RequestException as err:
+        resp = False
+        logger.debug("Error: %s", err)
+    return resp
+
+
+def check_urls_bulk(urls, concurrency=_HTTP_POOL_SIZE):
+    """ Checks many URLs as check_url does, with up to concurrency requests in flight at once
+
+    Returns
+    -------
+    resolved
+        dict mapping every distinct URL in urls to True if it resolves
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(urls))) as executor:
+        return dict(zip(urls, executor.map(_check_url, urls)))
+
+
+@_ttl_cache(maxsize=4096, ttl=_PROBE_TTL)
+def _check_doi(doi):
+    """ Returns True if doi is registered, asking doi.org for its CSL JSON citation
+    """
+    url = "https://doi.org/%s" % doi  # DOI solver URL
+    # Type of response accpeted
+    headers = {'Accept': 'application/vnd.citationstyles.csl+json;q=1.0'}
+    try:
+        r = _SESSION.post(url, headers=headers, timeout=_HTTP_TIMEOUT)  # POST with headers
+    except requests.RequestException as err:
+        logger.debug("Error: %s", err)
+        return False
+    logger.debug("%s: %s", url, r.status_code)
+    if r.status_code == 200:
+        return True
+    else:
+        return False
+
+
+@_ttl_cache(maxsize=1024, ttl=_PROBE_TTL)
+def _check_oai_pmh_item(base_url, identifier):
+    """ Returns True if the oai_dc record of identifier can be retrieved from base_url
+    """
+    try:
+        resp = False
+        url = f"{base_url}{_oai_query('GetRecord', metadataPrefix='oai_dc', identifier=identifier)}"
+        logger.debug("OAI-PMH URL: %s", url)
+        r = _SESSION.get(url, timeout=_HTTP_TIMEOUT)  # Get URL
+        xmlTree = etree.fromstring(r.content)
+        resp = True
+    except (requests.RequestException, etree.XMLSyntaxError) as err:
+        resp = False
+        logger.debug("Error: %s", err)
+    return resp
+
+
+def _oai_query(verb, **params):
+    """ Returns the query string of an OAI-PMH request, with the arguments URL-encoded
+    """
+    return '?' + urllib.parse.urlencode({'verb': verb, **params})
+
+
 def oai_identify(oai_base):
-    action = "?verb=Identify"
-    print("Request to: %s%s" % (oai_base, action))
+    action = _oai_query('Identify')
+    logger.debug("Request to: %s%s", oai_base, action)
     return oai_request(oai_base, action)
 
 
 def oai_metadataFormats(oai_base):
-    action = '?verb=ListMetadataFormats'
-    print("Request to: %s%s" % (oai_base, action))
+    action = _oai_query('ListMetadataFormats')
+    logger.debug("Request to: %s%s", oai_base, action)
     xmlTree = oai_request(oai_base, action)
     metadataFormats = {}
-    for e in xmlTree.findall('.//{http://www.openarchives.org/OAI/2.0/}metadataFormat'):
+    for e in _XPATH_FORMAT(xmlTree):
         metadataPrefix = e.find('{http://www.openarchives.org/OAI/2.0/}metadataPrefix').text
         namespace = e.find('{http://www.openarchives.org/OAI/2.0/}metadataNamespace').text
         metadataFormats[metadataPrefix] = namespace
-        print(metadataPrefix, ':', namespace)
+        logger.debug('%s: %s', metadataPrefix, namespace)
     return metadataFormats
 
 
+@lru_cache(maxsize=16)
+def cached_metadata_formats(oai_base):
+    """ Same as oai_metadataFormats, but the ListMetadataFormats request is only sent once per
+    OAI-PMH endpoint. The returned dict is shared and must not be modified.
+    """
+    return oai_metadataFormats(oai_base)
+
+
 def oai_check_record_url(oai_base, metadata_prefix, pid):
+    """ Returns the GetRecord URL of pid at oai_base, trying the identifier shapes used by the
+    repositories. The canonical oai:<host>:<pid> shape is tried first. Only when it fails are the
+    other shapes probed, concurrently, keeping the last one in the order below that succeeds.
+    Returns '' when none of them succeeds.
+    """
     endpoint_root = urllib.parse.urlparse(oai_base).netloc
-    pid_type = idutils.detect_identifier_schemes(pid)[0]
-    oai_pid = idutils.normalize_pid(pid, pid_type)
-    action = "?verb=GetRecord"
-    
-    test_id = "oai:%s:%s" % (endpoint_root, oai_pid)
-    params = "&metadataPrefix=%s&identifier=%s" % (metadata_prefix, test_id)
+    pid_type, oai_pid = _pid_info(pid)
+
+    test_ids = [
+        f"oai:{endpoint_root}:{oai_pid}",
+        f"{pid_type}:{oai_pid}",
+        f"oai:{endpoint_root}:{oai_pid[oai_pid.rfind('.')+1:]}",
+    ]
+    # The last shape is the first one again when the pid has no dots (e.g. Handles)
+    urls = list(dict.fromkeys(
+        f"{oai_base}{_oai_query('GetRecord', metadataPrefix=metadata_prefix, identifier=test_id)}"
+        for test_id in test_ids))
+    if _oai_probe(urls[0]) == 0:
+        return urls[0]
+
+    fallback_urls = urls[1:]
+    with ThreadPoolExecutor(max_workers=max(len(fallback_urls), 1)) as executor:
+        errors = list(executor.map(_oai_probe, fallback_urls))
+
     url_final = ''
-    url = oai_base + action + params
-    print("Trying: " + url)
-    response = requests.get(url)
-    print("Error?")
-    error = 0
-    for tags in ET.fromstring(response.text).findall('.//{http://www.openarchives.org/OAI/2.0/}error'):
-        print(tags.text)
-        error = error + 1
-    if error == 0:
-        url_final = url
-    
-    
-    test_id = "%s:%s" % (pid_type, oai_pid)
-    params = "&metadataPrefix=%s&identifier=%s" % (metadata_prefix, test_id)
-    
-    url = oai_base + action + params
-    print("Trying: " + url)
-    response = requests.get(url)
-    print("Error?")
-    error = 0
-    for tags in ET.fromstring(response.text).findall('.//{http://www.openarchives.org/OAI/2.0/}error'):
-        print(tags)
-        error = error + 1
-    if error == 0:
-        url_final = url
-    
-    test_id = "oai:%s:%s" % (endpoint_root, oai_pid[oai_pid.rfind(".")+1:len(oai_pid)])
-    params = "&metadataPrefix=%s&identifier=%s" % (metadata_prefix, test_id)
-    
-    url = oai_base + action + params
-    print("Trying: " + url)
-    response = requests.get(url)
-    print("Error?")
-    error = 0
-    for tags in ET.fromstring(response.text).findall('.//{http://www.openarchives.org/OAI/2.0/}error'):
-        print(tags)
-        error = error + 1
-    if error == 0:
-        url_final = url
-    
+    for url, error in zip(fallback_urls, errors):
+        if error == 0:
+            url_final = url
     return url_final
 
 
+@lru_cache(maxsize=8192)
+def _pid_info(pid):
+    """ Returns the first identifier scheme idutils detects for pid, and pid normalized for it
+    """
+    pid_type = idutils.detect_identifier_schemes(pid)[0]
+    return pid_type, idutils.normalize_pid(pid, pid_type)
+
+
+def _oai_probe(url):
+    """ Requests url and returns the number of OAI-PMH errors in the response. A request that
+    fails or an answer that is not XML counts as one error, so that shape is discarded.
+    """
+    logger.debug("Trying: %s", url)
+    try:
+        response = _SESSION.get(url, timeout=_HTTP_TIMEOUT)
+        tree = etree.fromstring(response.content)
+    except (requests.RequestException, etree.XMLSyntaxError) as err:
+        logger.debug("Error: %s", err)
+        return 1
+    errors = int(_XPATH_ERR_COUNT(tree))
+    if errors and logger.isEnabledFor(logging.DEBUG):
+        for tags in _XPATH_ERROR(tree):
+            logger.debug("OAI-PMH error: %s", tags.text)
+    return errors
+
+
 def oai_get_metadata(url):
-    oai = requests.get(url)
-    xmlTree = ET.fromstring(oai.text)
-    return xmlTree
+    """ Streams the GetRecord response at url into oai_parse_metadata, so the body is never
+    held in memory as a whole
+    """
+    with _SESSION.get(url, stream=True, timeout=_HTTP_TIMEOUT) as oai:
+        oai.raw.decode_content = True
+        return oai_parse_metadata(oai.raw)
+
+
+def oai_parse_metadata(source):
+    """ Returns one record (metadata_schema, element, text_value, qualifier) for every element
+    found below the <metadata> element of an OAI-PMH response, in document order. source is
+    parsed incrementally and every element is discarded once read, so memory stays bounded
+    for large records.
+    """
+    records = []
+    pending = []
+    inside = False
+    for event, elem in etree.iterparse(source, events=('start', 'end')):
+        if elem.tag == '{http://www.openarchives.org/OAI/2.0/}metadata':
+            inside = event == 'start'
+        elif not inside:
+            continue
+        elif event == 'start':
+            qname = etree.QName(elem)
+            pending.append(len(records))
+            records.append({'metadata_schema': '{%s}' % qname.namespace if qname.namespace else '',
+                            'element': qname.localname,
+                            'text_value': None,
+                            'qualifier': None})
+        else:
+            records[pending.pop()]['text_value'] = elem.text
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    return records
 
 
 def oai_request(oai_base, action):
-    oai = requests.get(oai_base + action) #Peticion al servidor
-    xmlTree = ET.fromstring(oai.text)
+    oai = _SESSION.get(f"{oai_base}{action}", timeout=_HTTP_TIMEOUT) #Peticion al servidor
+    xmlTree = etree.fromstring(oai.content)
     return xmlTree
+
+
+def head_request(url):
+    try:
+        return _SESSION.head(url, timeout=_HEAD_TIMEOUT, allow_redirects=True)
+    except requests.RequestException as e:
+        logger.debug("Error: %s", e)
+        return None
@@ -24,7 +24,7 @@ def repo_object(body):
 def rda_f1_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f1_01m()
+        points, msg = eva.run_indicator('rda_f1_01m')
         findable = {'name': 'RDA_F1_01M', 'msg': msg, 'points': points,
                     'color': eva.get_color(points),
                     'test_status': eva.test_status(points),
@@ -42,7 +42,7 @@ def rda_f1_01m(body):
 def rda_f1_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f1_01d()
+        points, msg = eva.run_indicator('rda_f1_01d')
         result = {'name': 'RDA_F1_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -60,7 +60,7 @@ def rda_f1_01d(body):
 def rda_f1_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f1_02m()
+        points, msg = eva.run_indicator('rda_f1_02m')
         result = {'name': 'RDA_F1_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -78,7 +78,7 @@ def rda_f1_02m(body):
 def rda_f1_02d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f1_02d()
+        points, msg = eva.run_indicator('rda_f1_02d')
         result = {'name': 'RDA_F1_02D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -96,7 +96,7 @@ def rda_f1_02d(body):
 def rda_f2_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f2_01m()
+        points, msg = eva.run_indicator('rda_f2_01m')
         result = {'name': 'RDA_F2_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -114,7 +114,7 @@ def rda_f2_01m(body):
 def rda_f3_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f3_01m()
+        points, msg = eva.run_indicator('rda_f3_01m')
         result = {'name': 'RDA_F3_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -132,7 +132,7 @@ def rda_f3_01m(body):
 def rda_f4_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_f4_01m()
+        points, msg = eva.run_indicator('rda_f4_01m')
         result = {'name': 'RDA_F4_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -150,7 +150,7 @@ def rda_f4_01m(body):
 def rda_a1_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_01m()
+        points, msg = eva.run_indicator('rda_a1_01m')
         result = {'name': 'RDA_A1_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -168,7 +168,7 @@ def rda_a1_01m(body):
 def rda_a1_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_02m()
+        points, msg = eva.run_indicator('rda_a1_02m')
         result = {'name': 'RDA_A1_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -186,7 +186,7 @@ def rda_a1_02m(body):
 def rda_a1_02d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_02d()
+        points, msg = eva.run_indicator('rda_a1_02d')
         result = {'name': 'RDA_A1_02D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -204,7 +204,7 @@ def rda_a1_02d(body):
 def rda_a1_03m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_03m()
+        points, msg = eva.run_indicator('rda_a1_03m')
         result = {'name': 'RDA_A1_03M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -222,7 +222,7 @@ def rda_a1_03m(body):
 def rda_a1_03d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_03d()
+        points, msg = eva.run_indicator('rda_a1_03d')
         result = {'name': 'RDA_A1_03D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -240,7 +240,7 @@ def rda_a1_03d(body):
 def rda_a1_04m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_04m()
+        points, msg = eva.run_indicator('rda_a1_04m')
         result = {'name': 'RDA_A1_04M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -258,7 +258,7 @@ def rda_a1_04m(body):
 def rda_a1_04d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_04d()
+        points, msg = eva.run_indicator('rda_a1_04d')
         result = {'name': 'RDA_A1_04D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -276,7 +276,7 @@ def rda_a1_04d(body):
 def rda_a1_05d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_05d()
+        points, msg = eva.run_indicator('rda_a1_05d')
         result = {'name': 'RDA_A1_05D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -294,7 +294,7 @@ def rda_a1_05d(body):
 def rda_a1_1_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_1_01m()
+        points, msg = eva.run_indicator('rda_a1_1_01m')
         result = {'name': 'RDA_A1.1_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -312,7 +312,7 @@ def rda_a1_1_01m(body):
 def rda_a1_1_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_1_01d()
+        points, msg = eva.run_indicator('rda_a1_1_01d')
         result = {'name': 'RDA_A1.1_01D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -330,7 +330,7 @@ def rda_a1_1_01d(body):
 def rda_a1_2_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a1_2_01d()
+        points, msg = eva.run_indicator('rda_a1_2_01d')
         result = {'name': 'RDA_A1.2_01D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -348,7 +348,7 @@ def rda_a1_2_01d(body):
 def rda_a2_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_a2_01m()
+        points, msg = eva.run_indicator('rda_a2_01m')
         result = {'name': 'RDA_A2_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -366,7 +366,7 @@ def rda_a2_01m(body):
 def rda_i1_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i1_01m()
+        points, msg = eva.run_indicator('rda_i1_01m')
         result = {'name': 'RDA_I1_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -384,7 +384,7 @@ def rda_i1_01m(body):
 def rda_i1_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i1_01d()
+        points, msg = eva.run_indicator('rda_i1_01d')
         result = {'name': 'RDA_I1_01D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -402,7 +402,7 @@ def rda_i1_01d(body):
 def rda_i1_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i1_02m()
+        points, msg = eva.run_indicator('rda_i1_02m')
         result = {'name': 'RDA_I1_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -420,7 +420,7 @@ def rda_i1_02m(body):
 def rda_i1_02d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i1_02d()
+        points, msg = eva.run_indicator('rda_i1_02d')
         result = {'name': 'RDA_I1_02D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -438,7 +438,7 @@ def rda_i1_02d(body):
 def rda_i2_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i2_01m()
+        points, msg = eva.run_indicator('rda_i2_01m')
         result = {'name': 'RDA_I2_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -456,7 +456,7 @@ def rda_i2_01m(body):
 def rda_i2_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i2_01d()
+        points, msg = eva.run_indicator('rda_i2_01d')
         result = {'name': 'RDA_I2_01D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -474,7 +474,7 @@ def rda_i2_01d(body):
 def rda_i3_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i3_01m()
+        points, msg = eva.run_indicator('rda_i3_01m')
         result = {'name': 'RDA_I3_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -492,7 +492,7 @@ def rda_i3_01m(body):
 def rda_i3_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i3_01d()
+        points, msg = eva.run_indicator('rda_i3_01d')
         result = {'name': 'RDA_I3_01D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -510,7 +510,7 @@ def rda_i3_01d(body):
 def rda_i3_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i3_02m()
+        points, msg = eva.run_indicator('rda_i3_02m')
         result = {'name': 'RDA_I3_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -528,7 +528,7 @@ def rda_i3_02m(body):
 def rda_i3_02d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i3_02d()
+        points, msg = eva.run_indicator('rda_i3_02d')
         result = {'name': 'RDA_I3_02D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -546,7 +546,7 @@ def rda_i3_02d(body):
 def rda_i3_03m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i3_03m()
+        points, msg = eva.run_indicator('rda_i3_03m')
         result = {'name': 'RDA_I3_03M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -564,7 +564,7 @@ def rda_i3_03m(body):
 def rda_i3_04m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_i3_04m()
+        points, msg = eva.run_indicator('rda_i3_04m')
         result = {'name': 'RDA_I3_04M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -582,7 +582,7 @@ def rda_i3_04m(body):
 def rda_r1_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_01m()
+        points, msg = eva.run_indicator('rda_r1_01m')
         result = {'name': 'RDA_R1_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -600,7 +600,7 @@ def rda_r1_01m(body):
 def rda_r1_1_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_1_01m()
+        points, msg = eva.run_indicator('rda_r1_1_01m')
         result = {'name': 'RDA_R1.1_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -618,7 +618,7 @@ def rda_r1_1_01m(body):
 def rda_r1_1_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_1_02m()
+        points, msg = eva.run_indicator('rda_r1_1_02m')
         result = {'name': 'RDA_R1.1_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -636,7 +636,7 @@ def rda_r1_1_02m(body):
 def rda_r1_1_03m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_1_03m()
+        points, msg = eva.run_indicator('rda_r1_1_03m')
         result = {'name': 'RDA_R1.1_03M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -654,7 +654,7 @@ def rda_r1_1_03m(body):
 def rda_r1_2_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_2_01m()
+        points, msg = eva.run_indicator('rda_r1_2_01m')
         result = {'name': 'RDA_R1.2_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -672,7 +672,7 @@ def rda_r1_2_01m(body):
 def rda_r1_2_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_2_02m()
+        points, msg = eva.run_indicator('rda_r1_2_02m')
         result = {'name': 'RDA_R1.2_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -690,7 +690,7 @@ def rda_r1_2_02m(body):
 def rda_r1_3_01m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_3_01m()
+        points, msg = eva.run_indicator('rda_r1_3_01m')
         result = {'name': 'RDA_R1.3_01M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -708,7 +708,7 @@ def rda_r1_3_01m(body):
 def rda_r1_3_01d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_3_01d()
+        points, msg = eva.run_indicator('rda_r1_3_01d')
         result = {'name': 'RDA_R1.3_01D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -726,7 +726,7 @@ def rda_r1_3_01d(body):
 def rda_r1_3_02m(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_3_02m()
+        points, msg = eva.run_indicator('rda_r1_3_02m')
         result = {'name': 'RDA_R1.3_02M', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -744,7 +744,7 @@ def rda_r1_3_02m(body):
 def rda_r1_3_02d(body):
     eva = repo_object(body)
     try:
-        points, msg = eva.rda_r1_3_02d()
+        points, msg = eva.run_indicator('rda_r1_3_02d')
         result = {'name': 'RDA_R1.3_02D', 'msg': msg, 'points': points,
                   'color': eva.get_color(points),
                   'test_status': eva.test_status(points),
@@ -784,7 +784,7 @@ def rda_all(body):
                 indi_code = e.split("/")
                 indi_code = indi_code[len(indi_code) - 1]
                 print("Running - %s" % indi_code)
-                points, msg = getattr(eva, indi_code)()
+                points, msg = eva.run_indicator(indi_code)
                 x_principle = documents['paths'][e]['x-principle']
                 if "Findable" in x_principle:
                     findable.update({indi_code: {
@@ -1,10 +1,44 @@
 from bs4 import BeautifulSoup
+import certifi
 import idutils
+import logging
+import numpy as np
 import pandas as pd
 import xml.etree.ElementTree as ET
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import urllib
+import urllib3
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# HTTP session shared by these helpers and the evaluators, so that connections to the same host
+# are reused across requests
+_HTTP_POOL_SIZE = 32
+# Requests sent at once by a single indicator checking many identifiers or namespaces. A quarter of
+# the pool, so several evaluations running at the same time do not wait for a connection
+_INDICATOR_WORKERS = _HTTP_POOL_SIZE // 4
+# (connect, read) timeouts in seconds for HEAD requests and for the rest of requests
+_HEAD_TIMEOUT = (3, 5)
+_HTTP_TIMEOUT = (5, 15)
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE,
+                       max_retries=Retry(total=2, backoff_factor=0.2,
+                                         status_forcelist=(502, 503, 504),
+                                         allowed_methods=frozenset(['HEAD', 'GET']),
+                                         raise_on_status=False))
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+# Certificates are verified against the certifi bundle once per session. The plugins still making
+# unverified requests on their own should not warn on every call
+_SESSION.verify = certifi.where()
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# Some publishers and license sites reject the default python-requests user agent
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; fair_eva/1.0)',
+                         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'})
+
 
 def is_persistent_id(item_id):
     """ is_persistent_id
@@ -55,42 +89,82 @@ def check_metadata_terms(metadata, terms):
     ----------
     metadata: data frame with the following columns: metadata_schema, element, text_value, qualifier
               contains the metadata of the digital object to be analyzed
-    terms: list of the metadata terms expected. DataFrame  where the identifier can be found
-        columns: terms, qualifier
+    terms: list of the metadata terms expected. Either a DataFrame with columns term, qualifier
+        or a sequence of (term, qualifier) pairs
     
     Returns
     -------
     checked_terms
         Data frame with the list of terms found and not found
     """
-    print(metadata) 
-    found = []
-    for e in terms.iterrows():
-        found.append(0)
-    terms['found'] = found
-    
-    for (index, row) in metadata.iterrows():
-        if row['element'] in terms.term.tolist():
-            if row['qualifier'] == terms.qualifier[terms[terms['term'] == row['element']].index.values[0]]:
-                terms.found[terms[terms['term'] == row['element']].index.values[0]] = 1
+    if not isinstance(terms, pd.DataFrame):
+        terms = pd.DataFrame(list(terms), columns=['term', 'qualifier'])
+
+    # A missing qualifier may be read as None or NaN depending on the dtype of the column
+    present = set(zip(metadata['element'], _qualifiers(metadata['qualifier'])))
+    terms['found'] = [1 if (term, qualifier) in present else 0
+                      for term, qualifier in zip(terms['term'], _qualifiers(terms['qualifier']))]
     return terms
 
 
+def _qualifiers(column):
+    """ Returns the values of a qualifier column, with None for every missing qualifier
+    """
+    return [None if pd.isna(qualifier) else qualifier for qualifier in column]
+
+
+def compile_data_formats(data_formats):
+    """ compile_data_formats
+    Builds a single regular expression matching links to files with any of the given extensions
+    Parameters
+    ----------
+    data_formats: list of file extensions, including the leading dot (e.g. ".csv")
+
+    Returns
+    -------
+    pattern
+        Compiled case-insensitive pattern that matches an URL ending with one of the extensions,
+        optionally followed by a query string or a fragment
+    """
+    return re.compile(r'(?:%s)(?:$|[?#])' % '|'.join(re.escape(f) for f in sorted(data_formats)), re.I)
+
+
+def standard_format_points(filenames, data_formats):
+    """ standard_format_points
+    Scores how many of the files are in one of the accepted formats
+    Parameters
+    ----------
+    filenames: list of file names
+    data_formats: accepted file extensions, without the leading dot (e.g. "csv")
+
+    Returns
+    -------
+    points
+        Percentage (float) of the files whose extension is an accepted format, 0.0 if there are
+        no files
+    """
+    if len(filenames) == 0:
+        return 0.0
+    exts = np.array([f.rsplit('.', 1)[-1].lower() for f in filenames])
+    hits = np.isin(exts, list(data_formats))
+    return float(100 * hits.mean())
+
+
 def find_dataset_file(metadata, url, data_formats):
-    response = requests.get(url, verify=False)
+    response = _SESSION.get(url, timeout=_HTTP_TIMEOUT)
     soup = BeautifulSoup(response.text, features="html.parser")
 
     msg = 'No dataset files found'
     points = 0
 
+    if not hasattr(data_formats, 'search'):
+        data_formats = compile_data_formats(data_formats)
+
     data_files = []
     for tag in soup.find_all("a"):
-        for f in data_formats:
-            try:
-                if f in tag.get('href'):
-                    data_files.append(tag.get('href'))
-            except Exception as e:
-                pass
+        href = tag.get('href')
+        if href and data_formats.search(href):
+            data_files.append(href)
 
     if len(data_files) > 0:
         points = 100
@@ -102,12 +176,12 @@ def find_dataset_file(metadata, url, data_formats):
 def metadata_human_accessibility(metadata, url):
     msg = ''
     points = 0
-    response = requests.get(url, verify=False)
+    response = _SESSION.get(url, timeout=_HTTP_TIMEOUT)
 
     found_items = 0
     for index, text in metadata.iterrows():
         if text['text_value'] in response.text:
-            print("FOUND: %s" % text['text_value'])
+            logger.debug("FOUND: %s", text['text_value'])
             found_items = found_items + 1
 
     msg = msg + "Found metadata terms (Human accesibility): %i/%i" % (found_items, len(metadata))
@@ -0,0 +1,212 @@
+from collections import OrderedDict
+import io
+
+import pandas as pd
+import pytest
+
+import api.evaluator as evaluator
+from api.evaluator import oai_parse_metadata
+
+RECORD = b"""<?xml version="1.0" encoding="UTF-8"?>
+<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+  <GetRecord>
+    <record>
+      <header>
+        <identifier>oai:digital.csic.es:10261/1</identifier>
+      </header>
+      <metadata>
+        <oai_dc:dc xmlns:oai_dc="http://www.openarchives.org/OAI/2.0/oai_dc/"
+                   xmlns:dc="http://purl.org/dc/elements/1.1/">
+          <dc:title>A title</dc:title>
+          <dc:creator>Doe, Jane</dc:creator>
+          <dc:identifier>http://hdl.handle.net/10261/1</dc:identifier>
+          <dc:subject/>
+        </oai_dc:dc>
+      </metadata>
+    </record>
+  </GetRecord>
+</OAI-PMH>"""
+
+DC = '{http://purl.org/dc/elements/1.1/}'
+
+
+def test_oai_parse_metadata_rows():
+    records = oai_parse_metadata(io.BytesIO(RECORD))
+    # The header is skipped, the metadata elements are returned in document order
+    assert [(r['metadata_schema'], r['element']) for r in records] == [
+        ('{http://www.openarchives.org/OAI/2.0/oai_dc/}', 'dc'),
+        (DC, 'title'), (DC, 'creator'), (DC, 'identifier'), (DC, 'subject')]
+    assert [r['text_value'] for r in records[1:]] == [
+        'A title', 'Doe, Jane', 'http://hdl.handle.net/10261/1', None]
+    assert all(r['qualifier'] is None for r in records)
+
+
+def test_oai_parse_metadata_without_metadata():
+    error = b"""<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+      <error code="idDoesNotExist">No matching identifier</error>
+    </OAI-PMH>"""
+    assert oai_parse_metadata(io.BytesIO(error)) == []
+
+
+class FakeResponse(object):
+    def __init__(self, content):
+        self.content = content
+
+
+def test_oai_check_record_url_skips_failed_shapes(monkeypatch):
+    found = b'<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/"><GetRecord/></OAI-PMH>'
+    missing = b"""<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">
+      <error code="idDoesNotExist">No matching identifier</error>
+    </OAI-PMH>"""
+
+    def get(url, timeout=None):
+        # Canonical oai:<host>:<pid> shape, then <scheme>:<pid>, then the pid suffix
+        if 'doi%3A' in url:
+            return FakeResponse(found)
+        if 'oai%3Arepo.example.org%3A10.1234' in url:
+            return FakeResponse(missing)
+        raise evaluator.requests.ReadTimeout('Read timed out')
+
+    monkeypatch.setattr(evaluator._SESSION, 'get', get)
+    url = evaluator.oai_check_record_url('http://repo.example.org/oai', 'oai_dc', '10.1234/abc.def')
+    assert 'identifier=doi%3A10.1234%2Fabc.def' in url
+
+
+def test_classify_identifier():
+    eva = evaluator.Evaluator('10261/1')
+    # Every DOI also looks like a Handle, it has to be classified as a DOI
+    assert eva.classify_identifier('https://doi.org/10.1234/abcd.5678') == ('doi', '10.1234/abcd.5678')
+    assert eva.classify_identifier('0000-0002-1825-0097') == ('orcid', '0000-0002-1825-0097')
+    assert eva.classify_identifier('http://hdl.handle.net/10261/12345') == ('handle', '10261/12345')
+    assert eva.classify_identifier('2021-03-04') == (None, '')
+    assert eva.classify_identifier(None) == (None, '')
+    assert eva.classify_identifier(float('nan')) == (None, '')
+
+
+class CountingEvaluator(evaluator.Evaluator):
+    """ Evaluator with an indicator counting how many times it is computed """
+
+    def __init__(self, item_id, oai_base=None):
+        super().__init__(item_id, oai_base)
+        self.runs = 0
+
+    def rda_counted(self):
+        self.runs = self.runs + 1
+        return (self.runs, 'run %i' % self.runs)
+
+    @evaluator._constant_indicator
+    def rda_fixed(self):
+        return (0, 'fixed')
+
+
+def metadata_frame(title):
+    return pd.DataFrame([['{http://purl.org/dc/elements/1.1/}', 'title', title, None]],
+                        columns=['metadata_schema', 'element', 'text_value', 'qualifier'])
+
+
+@pytest.fixture
+def indicator_cache(monkeypatch):
+    monkeypatch.setattr(evaluator, '_indicator_results', OrderedDict())
+    return evaluator._indicator_results
+
+
+def test_run_indicator_reuses_result(indicator_cache):
+    eva = CountingEvaluator('10261/1')
+    eva.metadata = metadata_frame('A title')
+    assert eva.run_indicator('rda_counted') == (1, 'run 1')
+    assert eva.run_indicator('rda_counted') == (1, 'run 1')
+    # Another evaluator of the same item with the same metadata reuses it too
+    other = CountingEvaluator('10261/1')
+    other.metadata = metadata_frame('A title')
+    assert other.run_indicator('rda_counted') == (1, 'run 1')
+    assert other.runs == 0
+
+
+def test_run_indicator_new_metadata(indicator_cache):
+    eva = CountingEvaluator('10261/1')
+    eva.metadata = metadata_frame('A title')
+    assert eva.run_indicator('rda_counted') == (1, 'run 1')
+    eva.metadata = metadata_frame('Another title')
+    assert eva.run_indicator('rda_counted') == (2, 'run 2')
+
+
+def test_run_indicator_expires(indicator_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(evaluator.time, 'monotonic', lambda: now[0])
+    eva = CountingEvaluator('10261/1')
+    eva.metadata = metadata_frame('A title')
+    assert eva.run_indicator('rda_counted') == (1, 'run 1')
+    now[0] += evaluator._PROBE_TTL - 1
+    assert eva.run_indicator('rda_counted') == (1, 'run 1')
+    now[0] += 1
+    assert eva.run_indicator('rda_counted') == (2, 'run 2')
+
+
+def test_run_indicator_evicts_least_recent(indicator_cache, monkeypatch):
+    monkeypatch.setattr(evaluator, '_INDICATOR_CACHE_SIZE', 2)
+    evas = [CountingEvaluator('10261/%i' % i) for i in range(3)]
+    for eva in evas:
+        eva.metadata = metadata_frame('A title')
+    evas[0].run_indicator('rda_counted')
+    evas[1].run_indicator('rda_counted')
+    # Using the first result makes the second one the least recently used
+    evas[0].run_indicator('rda_counted')
+    evas[2].run_indicator('rda_counted')
+    assert len(indicator_cache) == 2
+    evas[0].run_indicator('rda_counted')
+    evas[1].run_indicator('rda_counted')
+    assert [eva.runs for eva in evas] == [1, 2, 1]
+
+
+def test_run_indicator_constant_does_not_harvest(indicator_cache, monkeypatch):
+    def fail(self):
+        raise AssertionError('the metadata should not be harvested')
+
+    monkeypatch.setattr(CountingEvaluator, 'oai_harvest_metadata', fail)
+    monkeypatch.setattr(CountingEvaluator, '_get_metadata_digest', fail)
+    eva = CountingEvaluator('10261/1', 'http://repo.example.org/oai')
+    assert eva.run_indicator('rda_fixed') == (0, 'fixed')
+    assert len(indicator_cache) == 0
+
+
+def counted_ttl_function(maxsize, ttl):
+    calls = []
+
+    @evaluator._ttl_cache(maxsize=maxsize, ttl=ttl)
+    def double(x):
+        calls.append(x)
+        return 2 * x
+    return double, calls
+
+
+def test_ttl_cache_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(evaluator.time, 'monotonic', lambda: now[0])
+    double, calls = counted_ttl_function(maxsize=8, ttl=60)
+    assert double(1) == 2
+    now[0] += 59
+    assert double(1) == 2
+    assert calls == [1]
+    now[0] += 1
+    assert double(1) == 2
+    assert calls == [1, 1]
+
+
+def test_ttl_cache_evicts_least_recent():
+    double, calls = counted_ttl_function(maxsize=2, ttl=60)
+    double(1)
+    double(2)
+    # Using 1 again makes 2 the least recently used, evicted when 3 is added
+    double(1)
+    double(3)
+    double(1)
+    double(2)
+    assert calls == [1, 2, 3, 2]
+
+
+def test_ttl_cache_clear():
+    double, calls = counted_ttl_function(maxsize=8, ttl=60)
+    double(1)
+    double.cache_clear()
+    double(1)
+    assert calls == [1, 1]
@@ -0,0 +1,67 @@
+import pandas as pd
+
+import api.utils as ut
+
+
+def metadata_frame():
+    metadata = pd.DataFrame.from_records(
+        [('{http://purl.org/dc/elements/1.1/}', 'title', 'A title', None),
+         ('{http://purl.org/dc/elements/1.1/}', 'date', '2021-01-01', 'issued'),
+         ('{http://purl.org/dc/elements/1.1/}', 'identifier', 'http://hdl.handle.net/10261/1', None)],
+        columns=['metadata_schema', 'element', 'text_value', 'qualifier'])
+    # Harvested metadata stores the element column as a category
+    metadata['element'] = metadata['element'].astype('category')
+    return metadata
+
+
+def test_check_metadata_terms_pairs():
+    terms = ut.check_metadata_terms(metadata_frame(), [('title', None), ('date', 'issued'),
+                                                       ('date', None), ('creator', None)])
+    assert list(terms['term']) == ['title', 'date', 'date', 'creator']
+    assert list(terms['found']) == [1, 1, 0, 0]
+
+
+def test_check_metadata_terms_dataframe():
+    terms = pd.DataFrame([['identifier', None], ['rights', None]], columns=['term', 'qualifier'])
+    checked = ut.check_metadata_terms(metadata_frame(), terms)
+    assert list(checked['found']) == [1, 0]
+
+
+def test_standard_format_points():
+    formats = frozenset(['csv', 'pdf', 'nc'])
+    assert ut.standard_format_points([], formats) == 0.0
+    assert ut.standard_format_points(['data.csv', 'paper.pdf'], formats) == 100.0
+    assert ut.standard_format_points(['data.csv', 'notes.odt', 'image.tiff', 'run.nc'], formats) == 50.0
+    # Extensions are compared regardless of their case
+    assert ut.standard_format_points(['DATA.CSV', 'Paper.Pdf'], formats) == 100.0
+    assert all(isinstance(ut.standard_format_points(files, formats), float)
+               for files in ([], ['data.csv'], ['data.csv', 'notes.odt']))
+
+
+def test_compile_data_formats():
+    data_formats = ut.compile_data_formats(['.pdf', '.doc'])
+    assert data_formats.search('file.pdf')
+    assert data_formats.search('file.PDF?sequence=1')
+    assert data_formats.search('file.pdf#x')
+    assert not data_formats.search('pdfviewer/page')
+    # The extension has to end the path, .doc does not match a .docx file
+    assert not data_formats.search('file.docx')
+
+
+class FakeResponse(object):
+    def __init__(self, text):
+        self.text = text
+
+
+def test_find_dataset_file(monkeypatch):
+    page = ''.join('<a href="%s">link</a>' % href for href in
+                   ['file.pdf', 'file.PDF?sequence=1', 'file.pdf#x', 'pdfviewer/page', 'file.docx'])
+    monkeypatch.setattr(ut._SESSION, 'get', lambda url, timeout=None: FakeResponse(page))
+    points, msg, data_files = ut.find_dataset_file(metadata_frame(), 'http://repo.example.org/item',
+                                                   ['.pdf', '.doc'])
+    assert points == 100
+    assert data_files == ['file.pdf', 'file.PDF?sequence=1', 'file.pdf#x']
+
+    monkeypatch.setattr(ut._SESSION, 'get', lambda url, timeout=None: FakeResponse('<p>No links</p>'))
+    assert ut.find_dataset_file(metadata_frame(), 'http://repo.example.org/item', ['.pdf']) == \
+        (0, 'No dataset files found', [])